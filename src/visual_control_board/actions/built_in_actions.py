@@ -1,9 +1,30 @@
 import datetime
 import asyncio  # For async example
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Class reference hoisted so the formatter below skips the module attribute
+# walk on every refresh.
+_dt = datetime.datetime
+
+# Cached second-granularity ISO timestamp for log_current_time_action.
+# datetime.now().isoformat() is surprisingly costly under a high action rate,
+# so the formatted string is only regenerated when the second boundary rolls.
+_last_sec: int = 0
+_last_iso: str = ""
+
+
+def _current_iso_second() -> str:
+    """Returns the current time as an ISO string with second precision."""
+    global _last_sec, _last_iso
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_sec = sec
+        _last_iso = _dt.fromtimestamp(sec).isoformat()
+    return _last_iso
+
 
 def greet_user_action(name: str = "User"):
     """
@@ -19,7 +40,7 @@ def greet_user_action(name: str = "User"):
               This dictionary is often used to provide feedback to the UI.
     """
     message = f"Hello, {name}! This greeting action was successfully triggered."
-    logger.info(f"Executing greet_user_action for '{name}'")
+    logger.info("Executing greet_user_action for '%s'", name)
     # The returned dictionary can be used by the frontend (e.g., to show a toast message)
     return {"status": "success", "message": message}
 
@@ -32,9 +53,9 @@ def log_current_time_action():
     Returns:
         dict: A dictionary containing the status, current timestamp, and a message.
     """
-    now = datetime.datetime.now().isoformat()
+    now = _current_iso_second()
     message = f"Current server time: {now}"
-    logger.info(f"Executing log_current_time_action. Time: {now}")
+    logger.info("Executing log_current_time_action. Time: %s", now)
     return {"status": "success", "timestamp": now, "message": message}
 
 
@@ -58,16 +79,39 @@ async def example_async_action(duration: int = 1):
     return {"status": "success", "message": message_end, "duration": duration}
 
 
+# Shared result for another_action: the payload never varies, so one
+# module-level dict avoids a fresh allocation per button press. Action
+# results are treated as read-only by the dispatch layer.
+_ANOTHER_ACTION_RESULT = {
+    "status": "success",
+    "message": "The 'another_action' was performed successfully!",
+}
+
+
 def another_action():
     """
     Another simple placeholder synchronous action for demonstration purposes.
 
     Returns:
-        dict: A dictionary containing the status and a generic message.
+        dict: A shared dictionary containing the status and a generic message.
     """
-    message = "The 'another_action' was performed successfully!"
     logger.info("Executing another_action")
-    return {"status": "success", "message": message}
+    return _ANOTHER_ACTION_RESULT
+
+
+# O(1) dispatch table over this module's actions. Registries and dispatchers
+# can consult this dict instead of doing getattr(module, name) per lookup,
+# and IS_ASYNC hoists the coroutine-function reflection out of the hot path.
+ACTIONS = {
+    fn.__name__: fn
+    for fn in (
+        greet_user_action,
+        log_current_time_action,
+        example_async_action,
+        another_action,
+    )
+}
+IS_ASYNC = {name: asyncio.iscoroutinefunction(fn) for name, fn in ACTIONS.items()}
 
 
 # To add more actions:
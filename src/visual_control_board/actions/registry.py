@@ -1,24 +1,63 @@
-import importlib
-import inspect
-from typing import Callable, Dict, Any, Optional
+import types
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple
 import logging
 
 from visual_control_board.config.models import ActionDefinition, ActionsConfig
 
 logger = logging.getLogger(__name__)
 
+# Shared sentinel for parameterless dispatch; saves allocating a fresh empty
+# dict per call when a button defines no action_params.
+_NO_PARAMS: Dict[str, Any] = {}
+
 
 class ActionRegistry:
     """
     Manages the registration and execution of actions defined in the ActionsConfig.
     Actions are Python functions that can be dynamically loaded and called.
+
+    The registry is effectively write-once: `load_actions` builds the tables,
+    after which they are published as read-only mapping proxies. `__slots__`
+    keeps instances compact since the attribute set is fixed.
     """
 
+    __slots__ = ("_actions", "_action_definitions", "_dispatchers")
+
     def __init__(self):
-        self._actions: Dict[str, Callable] = {}
-        self._action_definitions: Dict[str, ActionDefinition] = {}
+        # Maps action id -> (callable, is_coroutine). The coroutine check is
+        # resolved once at registration so dispatch never pays the
+        # inspect.iscoroutinefunction wrapper-chain walk per call.
+        self._actions: Mapping[str, Tuple[Callable, bool]] = types.MappingProxyType({})
+        self._action_definitions: Mapping[str, ActionDefinition] = (
+            types.MappingProxyType({})
+        )
+        # Maps action id -> precompiled awaitable dispatcher. Each closure
+        # already knows whether its action is sync or async, so dispatch is a
+        # single dict lookup + call with no per-invocation branching.
+        self._dispatchers: Mapping[str, Callable] = types.MappingProxyType({})
         logger.debug("ActionRegistry initialized.")
 
+    @staticmethod
+    def _compile_dispatcher(func: Callable, is_coro: bool) -> Callable:
+        """Builds an async dispatcher closure bound to the resolved callable."""
+        # The empty-params branch calls the function directly, skipping the
+        # `**` splat's argument-parsing overhead for no-arg actions.
+        if is_coro:
+
+            async def _dispatch(params: Dict[str, Any], _func=func):
+                if params:
+                    return await _func(**params)
+                return await _func()
+
+        else:
+
+            async def _dispatch(params: Dict[str, Any], _func=func):
+                if params:
+                    return _func(**params)
+                return _func()
+
+        return _dispatch
+
     def load_actions(self, actions_config: Optional[ActionsConfig]):
         """
         Loads and registers actions from the provided ActionsConfig.
@@ -29,6 +68,12 @@ class ActionRegistry:
             actions_config: An ActionsConfig object containing the list of actions to load.
                             If None or empty, no actions are loaded.
         """
+        # Imported here rather than at module top: inspect drags in a large
+        # transitive graph (ast, dis, tokenize, ...) and both are only needed
+        # during registration, so importing ActionRegistry stays cheap.
+        import importlib
+        import inspect
+
         if not actions_config or not actions_config.actions:
             logger.warning(
                 "No actions found in configuration or ActionsConfig not provided. Action registry will be empty."
@@ -36,17 +81,39 @@ class ActionRegistry:
             return
 
         logger.info(f"Loading {len(actions_config.actions)} actions into registry...")
+        # Most action definitions point into the same handful of modules;
+        # resolve each module name once instead of going through the import
+        # system (name normalization + import lock) per action.
+        module_cache: Dict[str, Any] = {}
+        actions: Dict[str, Tuple[Callable, bool]] = {}
+        action_definitions: Dict[str, ActionDefinition] = {}
+        dispatchers: Dict[str, Callable] = {}
         for action_def in actions_config.actions:
             try:
                 logger.debug(
                     f"Attempting to load action '{action_def.id}': module='{action_def.module}', function='{action_def.function}'"
                 )
-                module = importlib.import_module(action_def.module)
-                func = getattr(module, action_def.function)
+                module = module_cache.get(action_def.module)
+                if module is None:
+                    module = importlib.import_module(action_def.module)
+                    module_cache[action_def.module] = module
+                # Modules may expose a prebuilt ACTIONS dispatch table (see
+                # built_in_actions.py); prefer it over per-name getattr.
+                actions_table = getattr(module, "ACTIONS", None)
+                if isinstance(actions_table, dict) and action_def.function in (
+                    actions_table
+                ):
+                    func = actions_table[action_def.function]
+                else:
+                    func = getattr(module, action_def.function)
 
                 if callable(func):
-                    self._actions[action_def.id] = func
-                    self._action_definitions[action_def.id] = action_def
+                    is_coro = inspect.iscoroutinefunction(func)
+                    actions[action_def.id] = (func, is_coro)
+                    action_definitions[action_def.id] = action_def
+                    dispatchers[action_def.id] = self._compile_dispatcher(
+                        func, is_coro
+                    )
                     logger.info(
                         f"Successfully registered action: ID='{action_def.id}' -> {action_def.module}.{action_def.function}"
                     )
@@ -69,6 +136,11 @@ class ActionRegistry:
                     f"An unexpected error occurred while loading action '{action_def.id}': {e}",
                     exc_info=True,
                 )
+        # Publish read-only views: the tables never mutate after load, which
+        # also keeps CPython's dict inline caches stable on the dispatch path.
+        self._actions = types.MappingProxyType(actions)
+        self._action_definitions = types.MappingProxyType(action_definitions)
+        self._dispatchers = types.MappingProxyType(dispatchers)
         logger.info(
             f"Action loading complete. {len(self._actions)} actions registered."
         )
@@ -83,10 +155,82 @@ class ActionRegistry:
         Returns:
             The callable function if found, otherwise None.
         """
-        action_func = self._actions.get(action_id)
-        if not action_func:
-            logger.warning(f"Action with ID '{action_id}' not found in registry.")
-        return action_func
+        entry = self._actions.get(action_id)
+        if not entry:
+            logger.warning("Action with ID '%s' not found in registry.", action_id)
+            return None
+        return entry[0]
+
+    def _get_entry(self, action_id: str) -> Optional[Tuple[Callable, bool]]:
+        """
+        Retrieves the (callable, is_coroutine) registration entry for an action.
+
+        Args:
+            action_id: The unique ID of the action.
+
+        Returns:
+            The registration tuple if found, otherwise None.
+        """
+        entry = self._actions.get(action_id)
+        if not entry:
+            logger.warning("Action with ID '%s' not found in registry.", action_id)
+        return entry
+
+    def is_sync_action(self, action_id: str) -> bool:
+        """
+        Returns True when the action is registered and synchronous, meaning
+        callers may use the `execute_action_sync` fast path.
+        """
+        entry = self._actions.get(action_id)
+        return bool(entry) and not entry[1]
+
+    def execute_action_sync(
+        self, action_id: str, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Synchronous fast path for non-coroutine actions. Skips the coroutine
+        allocation and event-loop round trip that `execute_action` pays even
+        for plain functions. Mirrors `execute_action`'s error contract.
+
+        Args:
+            action_id: The ID of the action to execute. Must be synchronous.
+            params: A dictionary of parameters to pass to the action function.
+
+        Returns:
+            The result of the action function, or an error dictionary.
+        """
+        entry = self._get_entry(action_id)
+        if not entry:
+            error_msg = f"Action '{action_id}' not found in registry. Cannot execute."
+            logger.error(error_msg)
+            return {"status": "error", "error": error_msg, "message": error_msg}
+
+        action_func, is_coro = entry
+        if is_coro:
+            error_msg = (
+                f"Action '{action_id}' is asynchronous; use execute_action instead."
+            )
+            logger.error(error_msg)
+            return {"status": "error", "error": error_msg, "message": error_msg}
+
+        try:
+            logger.info(
+                "Executing action '%s' with params: %s",
+                action_id,
+                params if params else "No params",
+            )
+            result = action_func(**params) if params else action_func()
+            logger.info("Action '%s' executed successfully.", action_id)
+            logger.debug("Result for action '%s': %s", action_id, result)
+            return result
+        except Exception as e:
+            error_msg = f"Error during execution of action '{action_id}': {str(e)}"
+            logger.error(f"Error executing action '{action_id}': {e}", exc_info=True)
+            return {
+                "status": "error",
+                "error": error_msg,
+                "message": error_msg,
+            }  # Ensure message for toast
 
     async def execute_action(
         self, action_id: str, params: Optional[Dict[str, Any]] = None
@@ -105,8 +249,8 @@ class ActionRegistry:
             or an error occurs during execution, a dictionary with an "error" key
             is returned.
         """
-        action_func = self.get_action(action_id)
-        if not action_func:
+        dispatcher = self._dispatchers.get(action_id)
+        if dispatcher is None:
             error_msg = f"Action '{action_id}' not found in registry. Cannot execute."
             logger.error(error_msg)
             return {
@@ -116,28 +260,21 @@ class ActionRegistry:
             }  # Ensure message for toast
 
         if params is None:
-            params = {}
+            params = _NO_PARAMS
 
         try:
+            # %-style args defer all formatting (including the params repr)
+            # until a handler actually emits the record.
             logger.info(
-                f"Executing action '{action_id}' with params: {params if params else 'No params'}"
+                "Executing action '%s' with params: %s",
+                action_id,
+                params if params else "No params",
             )
 
-            if inspect.iscoroutinefunction(action_func):
-                # Action is an async function
-                logger.debug(
-                    f"Action '{action_id}' is an async function. Awaiting execution."
-                )
-                result = await action_func(**params)
-            else:
-                # Action is a sync function
-                logger.debug(
-                    f"Action '{action_id}' is a sync function. Executing directly."
-                )
-                result = action_func(**params)
+            result = await dispatcher(params)
 
-            logger.info(f"Action '{action_id}' executed successfully.")
-            logger.debug(f"Result for action '{action_id}': {result}")
+            logger.info("Action '%s' executed successfully.", action_id)
+            logger.debug("Result for action '%s': %s", action_id, result)
             return result
         except Exception as e:
             error_msg = f"Error during execution of action '{action_id}': {str(e)}"
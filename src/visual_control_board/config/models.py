@@ -1,41 +1,29 @@
+import sys
+from functools import cached_property
 from typing import List, Optional, Dict, Any, Tuple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Loaded configurations are read-many/write-never: freezing them lets
+# pydantic skip per-field setter validation and guards against accidental
+# mutation of the shared app.state config trees.
+_FROZEN = ConfigDict(frozen=True)
 
-class ButtonActionParams(BaseModel):
-    """
-    Flexible model for action parameters.
-    This model uses Pydantic's capability to allow arbitrary key-value pairs.
-    This provides flexibility for actions to define their own expected parameters
-    without needing a new Pydantic model for each action's parameter set.
-
-    When an action is triggered, these parameters are passed as a dictionary
-    to the corresponding action function. It is the responsibility of the
-    action function to handle and validate these parameters as needed.
-
-    For actions requiring specific, validated parameters, future enhancements could involve:
-    1. Defining specific Pydantic models for those parameters and using them within
-       the action function for validation.
-    2. Implementing a discriminated union approach if a more complex, centralized
-       validation scheme per action type is desired before dispatch.
-
-    Example:
-        If `action_params` in `ui_config.yaml` is:
-        ```yaml
-        action_params:
-          url: "http://example.com"
-          retries: 3
-        ```
-        The action function will receive `{"url": "http://example.com", "retries": 3}`.
-    """
 
-    class Config:
-        extra = "allow"  # Allows any additional fields not explicitly defined.
+# Note on action parameters: `action_params` is deliberately a plain dict
+# rather than a nested model. The values are arbitrary key/value pairs that
+# are handed to the action function as keyword arguments; it is the action's
+# responsibility to validate them. A plain dict skips one sub-model
+# construction per button on every config load/update. Actions that need
+# validated parameters can define their own Pydantic model and validate
+# inside the function (or a discriminated-union scheme could be introduced
+# centrally later, if ever warranted).
 
 
 class ButtonConfig(BaseModel):
     """Configuration for a single button in the UI."""
 
+    model_config = _FROZEN
+
     id: str = Field(
         ..., description="Unique identifier for the button. Used for targeting actions."
     )
@@ -56,8 +44,8 @@ class ButtonConfig(BaseModel):
         ...,
         description="Identifier of the action to be executed, as defined in actions_config.yaml.",
     )
-    action_params: ButtonActionParams = Field(
-        default_factory=ButtonActionParams,
+    action_params: Dict[str, Any] = Field(
+        default_factory=dict,
         description="Parameters to pass to the action function. Structure depends on the action.",
     )
 
@@ -66,10 +54,17 @@ class ButtonConfig(BaseModel):
         description="URL for dynamically fetching button content (e.g., text, icon). Deprecated in favor of WebSocket updates.",
     )
 
+    # Identifiers repeat heavily across a config (every button names an
+    # action id); interning keeps one str object per unique value, which
+    # trims resident memory and lets dict probes compare by pointer.
+    _intern_ids = field_validator("id", "action_id", mode="after")(sys.intern)
+
 
 class PageConfig(BaseModel):
     """Configuration for a single page or view in the UI."""
 
+    model_config = _FROZEN
+
     name: str = Field(
         ..., description="Display name of the page, often used as a title."
     )
@@ -87,39 +82,59 @@ class PageConfig(BaseModel):
         ..., description="List of buttons to display on this page."
     )
 
+    @cached_property
+    def buttons_by_id(self) -> Dict[str, ButtonConfig]:
+        """O(1) button lookup index, built lazily on first access.
+
+        The model is frozen, so the index never goes stale once built.
+        """
+        return {button.id: button for button in self.buttons}
+
 
 class UIConfig(BaseModel):
     """Root configuration model for the entire UI structure."""
 
+    model_config = _FROZEN
+
     pages: List[PageConfig] = Field(
         ...,
         description="List of pages in the UI. The application now supports navigation between these pages.",
     )
 
+    @cached_property
+    def pages_by_id(self) -> Dict[str, PageConfig]:
+        """O(1) page lookup index, built lazily on first access."""
+        return {page.id: page for page in self.pages}
+
+    @cached_property
+    def _button_index(self) -> Dict[str, Tuple[PageConfig, ButtonConfig]]:
+        """O(1) button-id -> (page, button) index, built lazily on first access."""
+        return {
+            button.id: (page, button)
+            for page in self.pages
+            for button in page.buttons
+        }
+
     def find_button_and_page(
         self, button_id: str
     ) -> Optional[Tuple[PageConfig, ButtonConfig]]:
         """
         Finds a button by its ID across all pages and returns it along with its parent page.
 
+        This runs on every button press, so it is a dict probe against the
+        cached index rather than a scan over every page and button.
+
         Args:
             button_id: The ID of the button to find.
 
         Returns:
             A tuple containing the PageConfig and ButtonConfig if found, otherwise None.
         """
-        if not self.pages:
-            return None
-        for page in self.pages:
-            if page.buttons:
-                for button in page.buttons:
-                    if button.id == button_id:
-                        return page, button
-        return None
+        return self._button_index.get(button_id)
 
     def find_page(self, page_id: str) -> Optional[PageConfig]:
         """
-        Finds a page by its ID.
+        Finds a page by its ID via the cached index.
 
         Args:
             page_id: The ID of the page to find.
@@ -127,17 +142,14 @@ class UIConfig(BaseModel):
         Returns:
             The PageConfig if found, otherwise None.
         """
-        if not self.pages:
-            return None
-        for page in self.pages:
-            if page.id == page_id:
-                return page
-        return None
+        return self.pages_by_id.get(page_id)
 
 
 class ActionDefinition(BaseModel):
     """Defines a single action that can be triggered by a button."""
 
+    model_config = _FROZEN
+
     id: str = Field(
         ...,
         description="Unique identifier for the action. Referenced by ButtonConfig.action_id.",
@@ -150,14 +162,25 @@ class ActionDefinition(BaseModel):
         ..., description="Name of the action function within the specified module."
     )
 
+    # Same rationale as ButtonConfig: many definitions share the module
+    # string, and ids/function names are looked up in dicts constantly.
+    _intern_ids = field_validator("id", "module", "function", mode="after")(sys.intern)
+
 
 class ActionsConfig(BaseModel):
     """Root configuration model for all available actions."""
 
+    model_config = _FROZEN
+
     actions: List[ActionDefinition] = Field(
         ..., description="List of all action definitions available to the application."
     )
 
+    @cached_property
+    def actions_by_id(self) -> Dict[str, ActionDefinition]:
+        """O(1) action-definition lookup index, built lazily on first access."""
+        return {action.id: action for action in self.actions}
+
 
 class DynamicUpdateConfig(BaseModel):
     """
@@ -208,3 +231,14 @@ class ButtonContentUpdate(BaseModel):
         default=None,
         description="Data and configuration for rendering a sparkline on the button. If provided, typically replaces the icon.",
     )
+
+
+class ButtonContentBatchUpdate(BaseModel):
+    """
+    Model for pushing several button content updates in a single API call.
+    Lets controllers coalesce co-occurring updates into one round trip.
+    """
+
+    updates: List[ButtonContentUpdate] = Field(
+        ..., description="Button content updates to broadcast, in order."
+    )
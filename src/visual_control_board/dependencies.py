@@ -1,14 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
 from fastapi import Request, HTTPException, WebSocket
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
+import asyncio
 import logging
 
-from .config.models import UIConfig, ActionsConfig
-from .actions.registry import ActionRegistry
-from .live_updates import LiveUpdateManager
+# These modules are only needed here as annotation targets — the dependency
+# getters never construct them — so the imports are deferred to type-checking
+# time. Importing this module alone no longer pulls pydantic/yaml/asyncio
+# machinery into the graph.
+if TYPE_CHECKING:
+    from .config.models import UIConfig, ActionsConfig
+    from .actions.registry import ActionRegistry
+    from .live_updates import LiveUpdateManager
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class AppRuntime:
+    """
+    Immutable snapshot of the per-process runtime objects routes depend on.
+
+    Built once at startup and rebuilt (as a fresh instance) whenever a staged
+    configuration is applied, then swapped into `app.state.runtime` in a
+    single atomic assignment. Handlers that need several of these objects can
+    depend on `get_runtime` and pay one attribute lookup instead of one
+    dependency resolution per object.
+    """
+
+    ui_config: UIConfig
+    actions_config: ActionsConfig
+    action_registry: ActionRegistry
+    live_update_manager: LiveUpdateManager
+
+
+def get_runtime(request: Request) -> AppRuntime:
+    """
+    FastAPI dependency returning the current AppRuntime snapshot.
+    """
+    runtime: Optional[AppRuntime] = getattr(request.app.state, "runtime", None)
+    if runtime is None:
+        logger.critical(
+            "AppRuntime snapshot not found in application state. This indicates a severe startup issue."
+        )
+        raise HTTPException(
+            status_code=503, detail="Application runtime is currently unavailable."
+        )
+    return runtime
+
+
 def get_current_ui_config(request: Request) -> Optional[UIConfig]:
     """
     FastAPI dependency to retrieve the *currently active* UIConfig from application state.
@@ -62,8 +104,12 @@ def get_action_registry(request: Request) -> ActionRegistry:
 def get_pending_update_flag(request: Request) -> bool:
     """
     FastAPI dependency to retrieve the flag indicating if a configuration update is pending.
+    A missing event (lifespan never ran) reads as no pending update.
     """
-    return getattr(request.app.state, "pending_update_available", False)
+    event: Optional[asyncio.Event] = getattr(
+        request.app.state, "pending_update_event", None
+    )
+    return event is not None and event.is_set()
 
 
 def get_live_update_manager(request: Request) -> LiveUpdateManager:
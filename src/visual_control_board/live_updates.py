@@ -1,40 +1,97 @@
 import asyncio
+import json
 import logging
-from typing import List, Dict, Any
+from typing import Dict, Any, Optional, Set
 from fastapi import WebSocket
 
+# orjson encodes several times faster than stdlib json and matters here:
+# broadcasts serialize once per message, on every live update.
+try:
+    import orjson
+
+    def _encode_json(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data).decode()
+
+except ImportError:
+
+    def _encode_json(data: Dict[str, Any]) -> str:
+        return json.dumps(data, separators=(",", ":"))
+
+
 logger = logging.getLogger(__name__)
 
+# Control message telling clients to refresh their navigation panel. The
+# content never varies, so it is encoded exactly once at import and broadcast
+# as a raw frame.
+NAV_UPDATE_FRAME = _encode_json({"type": "navigation_update", "payload": {}})
+
 
 class LiveUpdateManager:
     """
     Manages active WebSocket connections and broadcasts messages for live updates.
     """
 
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(
+        self,
+        send_concurrency: int = 256,
+        send_timeout: float = 2.0,
+        flush_interval: float = 0.03,
+    ):
+        """
+        Args:
+            send_concurrency: Maximum number of in-flight sends per broadcast,
+                              bounding scheduler/memory pressure on large fan-outs.
+            send_timeout: Seconds a single socket may take to accept a frame
+                          before it is treated as dead and dropped.
+            flush_interval: Coalescing window for button content updates;
+                            rapid updates to the same button within this
+                            window collapse to the last write.
+        """
+        # A set gives O(1) add/discard; broadcasts snapshot it into a list
+        # so membership can change while sends are in flight.
+        self.active_connections: Set[WebSocket] = set()
+        self._send_semaphore = asyncio.Semaphore(send_concurrency)
+        self._send_timeout = send_timeout
+        # Last-write-wins staging area for button updates, drained by a lazy
+        # background flush task after each coalescing window.
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._pending_event = asyncio.Event()
+        self._flush_interval = flush_interval
+        self._flush_task: Optional[asyncio.Task] = None
         logger.info("LiveUpdateManager initialized.")
 
+    async def _send(self, connection: WebSocket, payload: str):
+        """
+        Sends one pre-serialized frame under the concurrency bound. A slow or
+        backpressured client times out instead of stalling the whole
+        broadcast behind its send buffer.
+        """
+        async with self._send_semaphore:
+            await asyncio.wait_for(
+                connection.send_text(payload), timeout=self._send_timeout
+            )
+
     async def connect(self, websocket: WebSocket):
         """
-        Accepts a new WebSocket connection and adds it to the list of active connections.
+        Accepts a new WebSocket connection and adds it to the set of active connections.
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connection established: {websocket.client}")
-        logger.debug(f"Total active connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        logger.info("WebSocket connection established: %s", websocket.client)
+        logger.debug("Total active connections: %d", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket):
         """
-        Removes a WebSocket connection from the list of active connections.
+        Removes a WebSocket connection from the set of active connections.
         """
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.info(f"WebSocket connection closed: {websocket.client}")
-            logger.debug(f"Total active connections: {len(self.active_connections)}")
+            self.active_connections.discard(websocket)
+            logger.info("WebSocket connection closed: %s", websocket.client)
+            logger.debug("Total active connections: %d", len(self.active_connections))
         else:
             logger.warning(
-                f"Attempted to disconnect a WebSocket that was not in active_connections: {websocket.client}"
+                "Attempted to disconnect a WebSocket that was not in active_connections: %s",
+                websocket.client,
             )
 
     async def broadcast_json(self, data: Dict[str, Any]):
@@ -45,39 +102,48 @@ class LiveUpdateManager:
             logger.debug("No active WebSocket connections to broadcast to.")
             return
 
+        # The payload repr can be large (sparkline arrays); only build it
+        # when DEBUG is actually emitting.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Broadcast payload: %s", data)
+
+        # Serialize once and send the same text frame to every socket:
+        # send_json would re-encode the identical dict per connection.
+        await self.broadcast_frame(_encode_json(data))
+
+    async def broadcast_frame(self, payload: str):
+        """
+        Broadcasts an already-encoded JSON text frame to all active
+        connections. Lets callers with constant messages (e.g.
+        `NAV_UPDATE_FRAME`) skip encoding entirely.
+        """
+        if not self.active_connections:
+            logger.debug("No active WebSocket connections to broadcast to.")
+            return
+
         logger.info(
-            f"Broadcasting JSON data to {len(self.active_connections)} connection(s): {data}"
+            "Broadcasting frame to %d connection(s).", len(self.active_connections)
         )
 
-        # Create a list of tasks for sending messages concurrently
-        # If a connection is closed, sending will raise an error.
-        # We should handle this gracefully and remove dead connections.
-        tasks = []
-        dead_connections = []
+        # Snapshot the set so concurrent connects/disconnects cannot shift
+        # result positions; zip keeps each result paired with its socket
+        # (the old index arithmetic could blame the wrong connection).
+        snapshot = list(self.active_connections)
+        results = await asyncio.gather(
+            *(self._send(connection, payload) for connection in snapshot),
+            return_exceptions=True,
+        )
 
-        for connection in self.active_connections:
-            try:
-                # Create a task for each send operation
-                tasks.append(connection.send_json(data))
-            except Exception as e:  # Broad exception to catch various WebSocket errors
-                logger.warning(
-                    f"Error preparing to send to WebSocket {connection.client}: {e}. Marking for removal."
+        dead_connections = []
+        for connection, result in zip(snapshot, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to send message to WebSocket %s: %s. Marking for removal.",
+                    connection.client,
+                    result,
                 )
                 dead_connections.append(connection)
 
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    connection = self.active_connections[
-                        i - len(dead_connections)
-                    ]  # Adjust index if some were already marked
-                    logger.error(
-                        f"Failed to send message to WebSocket {connection.client}: {result}. Marking for removal."
-                    )
-                    if connection not in dead_connections:  # Avoid double-adding
-                        dead_connections.append(connection)
-
         # Remove all identified dead connections
         for dead_connection in dead_connections:
             self.disconnect(dead_connection)
@@ -86,14 +152,75 @@ class LiveUpdateManager:
             logger.debug("Broadcast successful to all connections.")
         else:
             logger.info(
-                f"Removed {len(dead_connections)} dead connections during broadcast."
+                "Removed %d dead connections during broadcast.", len(dead_connections)
             )
 
     async def broadcast_button_update(self, update_data: Dict[str, Any]):
         """
-        Specifically broadcasts a button content update.
-        The `update_data` should conform to what the client-side JavaScript expects,
-        typically including `type: "button_content_update"` and the payload.
+        Queues a button content update for broadcast.
+
+        Updates are coalesced per button id over a short window
+        (`flush_interval`): a producer pushing many updates for the same
+        button only costs one serialized frame for the final state, which is
+        all clients can render anyway. A lone update goes out as the familiar
+        `button_content_update` message; multiple distinct buttons in one
+        window go out as a single `button_content_updates_batch` frame.
+        """
+        button_id = update_data.get("button_id")
+        if button_id is None:
+            # Malformed/free-form update: pass straight through, unbatched.
+            await self.broadcast_json(
+                {"type": "button_content_update", "payload": update_data}
+            )
+            return
+
+        pending = self._pending_updates.get(button_id)
+        if pending is None:
+            self._pending_updates[button_id] = dict(update_data)
+        else:
+            pending.update(update_data)
+        self._pending_event.set()
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """
+        Background drain: waits for pending updates, sleeps one coalescing
+        window to absorb the burst, then broadcasts the collapsed state.
+        """
+        while True:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            await asyncio.sleep(self._flush_interval)
+            if not self._pending_updates:
+                continue
+            batch = list(self._pending_updates.values())
+            self._pending_updates.clear()
+            if len(batch) == 1:
+                await self.broadcast_json(
+                    {"type": "button_content_update", "payload": batch[0]}
+                )
+            else:
+                await self.broadcast_json(
+                    {"type": "button_content_updates_batch", "payload": batch}
+                )
+
+    async def aclose(self):
+        """
+        Flushes anything still pending and stops the background drain task.
+        Called from application shutdown.
         """
-        message_to_broadcast = {"type": "button_content_update", "payload": update_data}
-        await self.broadcast_json(message_to_broadcast)
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._pending_updates:
+            batch = list(self._pending_updates.values())
+            self._pending_updates.clear()
+            await self.broadcast_json(
+                {"type": "button_content_updates_batch", "payload": batch}
+            )
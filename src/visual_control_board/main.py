@@ -1,46 +1,120 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+import asyncio
 import logging
+import os
+import queue
+import re
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TYPE_CHECKING
 
-from .config.loader import ConfigLoader
-from .config.models import UIConfig, ActionsConfig
 from .actions.registry import ActionRegistry
+from .dependencies import AppRuntime
 from .web import routes as web_routes
 from .live_updates import LiveUpdateManager  # Added import
 
+# ConfigLoader (and the yaml/pickle machinery behind it) is only needed once,
+# inside the lifespan handler, so importing this module stays cheap for
+# anything that just wants the `app` object or its routes. The model classes
+# are annotation-only here.
+if TYPE_CHECKING:
+    from .config.models import UIConfig, ActionsConfig
+
 # --- Logging Setup ---
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stdout)],
 )
+
+# Route all records through a queue so stream I/O happens on the listener's
+# background thread instead of inside async request handlers, where a slow or
+# blocked stdout would stall the event loop. The listener lives for exactly
+# one lifespan cycle: started on startup, stopped (and the queue drained) at
+# the end of shutdown, with the direct handlers restored in between so a
+# process that runs several lifespans — e.g. consecutive TestClient blocks —
+# keeps logging across all of them.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener: Optional[QueueListener] = None
+_direct_handlers: list[logging.Handler] = []
+
+
+def _start_log_listener() -> None:
+    global _log_listener
+    if _log_listener is not None:
+        return
+    root_logger = logging.getLogger()
+    _direct_handlers[:] = root_logger.handlers
+    _log_listener = QueueListener(
+        _log_queue, *_direct_handlers, respect_handler_level=True
+    )
+    root_logger.handlers = [QueueHandler(_log_queue)]
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    global _log_listener
+    if _log_listener is None:
+        return
+    # Drains the queue before returning, so records already enqueued land.
+    _log_listener.stop()
+    _log_listener = None
+    logging.getLogger().handlers = list(_direct_handlers)
+
+
 logger = logging.getLogger(__name__)
 
 package_base_dir = Path(__file__).parent.resolve()
 
-app = FastAPI(
-    title="Visual Control Board",
-    description="A web-based visual control board for triggering custom actions, with dynamic update and live streaming capabilities.",
-    version="0.1.2",  # Incremented version for new feature
-)
+# Filenames carrying a content hash (e.g. main.a1b2c3d4.js) change whenever
+# their content does, so browsers may cache them forever.
+_HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{8,}\.")
 
-app.mount("/static", StaticFiles(directory=package_base_dir / "static"), name="static")
 
-app.include_router(web_routes.router)
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with explicit Cache-Control headers.
+
+    Plain starlette StaticFiles sends no Cache-Control at all, so browsers
+    revalidate main.js/style.css on every page load. Unhashed assets get a
+    short max-age so a board refresh picks up upgrades promptly; content-
+    hashed filenames (if the assets ever grow a build step) are immutable.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        path = args[0] if args else kwargs.get("full_path", "")
+        if _HASHED_ASSET_RE.search(os.path.basename(str(path))):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=300"
+        return response
 
 
-@app.on_event("startup")
-async def startup_event():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    Application startup event handler.
-    Initializes configurations, action registry, and live update manager.
-    Sets up state for current and potentially staged configurations.
+    Application lifespan handler (replaces the deprecated on_event hooks).
+    Initializes configurations, action registry, and live update manager
+    before the app serves requests; tears the manager down afterwards.
     """
+    _start_log_listener()
     logger.info("Application starting up...")
 
+    # Eager tasks (3.12+) let coroutines that finish without suspending —
+    # e.g. sync actions wrapped by ActionRegistry.execute_action — complete
+    # inline instead of taking a trip through the event loop's ready queue.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        logger.info("Enabled eager task factory on the event loop.")
+
+    from .config.loader import ConfigLoader
+
     config_loader_instance = ConfigLoader()
     config_loader_instance.load_configs()
 
@@ -50,10 +124,22 @@ async def startup_event():
         config_loader_instance.actions_config
     )
 
-    # Initialize staged configurations (for dynamic updates)
+    # Initialize staged configurations (for dynamic updates). The pending
+    # flag is an asyncio.Event: is_set() is a C-level boolean read for the
+    # per-request dependency, and the attribute always exists so no getattr
+    # default fallback is ever taken.
     app.state.staged_ui_config: Optional[UIConfig] = None
     app.state.staged_actions_config: Optional[ActionsConfig] = None
-    app.state.pending_update_available: bool = False
+    app.state.staged_action_registry: Optional[ActionRegistry] = None
+    app.state.pending_update_event = asyncio.Event()
+    # Rendered index pages keyed by (page_id, banner shown) and per-page OOB
+    # chrome fragments (nav/title/header); both cleared when a staged
+    # configuration is applied.
+    app.state.index_html_cache = {}
+    app.state.oob_chrome_cache = {}
+    # Lazily-computed digest of the active UI config backing partial-endpoint
+    # ETags; reset on apply alongside the render caches.
+    app.state.config_version_tag = None
 
     # Initialize Live Update Manager
     app.state.live_update_manager = LiveUpdateManager()
@@ -93,15 +179,40 @@ async def startup_event():
     app.state.action_registry: ActionRegistry = action_registry_instance
     logger.info("Action registry initialized with current actions.")
 
+    # One frozen snapshot of everything request handlers depend on; swapped
+    # atomically on config apply so a handler never sees a half-updated set.
+    app.state.runtime = AppRuntime(
+        ui_config=app.state.current_ui_config,
+        actions_config=app.state.current_actions_config,
+        action_registry=action_registry_instance,
+        live_update_manager=app.state.live_update_manager,
+    )
+
     logger.info("Application startup complete. Ready to accept requests.")
 
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Application shutdown event handler.
-    """
     logger.info("Application shutting down...")
-    # Potentially close WebSocket connections gracefully if manager supports it
-    # For now, connections will be closed by the server shutting down.
+    # Flush any coalesced button updates and stop the manager's drain task.
+    # Connections themselves are closed by the server shutting down.
+    manager: Optional[LiveUpdateManager] = getattr(
+        app.state, "live_update_manager", None
+    )
+    if manager is not None:
+        await manager.aclose()
     logger.info("Application shutdown complete.")
+    _stop_log_listener()
+
+
+app = FastAPI(
+    title="Visual Control Board",
+    description="A web-based visual control board for triggering custom actions, with dynamic update and live streaming capabilities.",
+    version="0.1.2",  # Incremented version for new feature
+    lifespan=lifespan,
+)
+
+app.mount(
+    "/static", CachedStaticFiles(directory=package_base_dir / "static"), name="static"
+)
+
+app.include_router(web_routes.router)
@@ -36,6 +36,12 @@ function connectWebSocket() {
                 // Store the latest payload in our cache
                 liveButtonStates[message.payload.button_id] = message.payload;
                 updateButtonContent(message.payload);
+            } else if (message.type === "button_content_updates_batch" && Array.isArray(message.payload)) {
+                // Server coalesces rapid updates into one frame; apply each.
+                for (const payload of message.payload) {
+                    liveButtonStates[payload.button_id] = payload;
+                    updateButtonContent(payload);
+                }
             } else if (message.type === "navigation_update") {
                 console.log("Navigation update message received. Refreshing navigation panel.");
                 refreshNavigationPanel();
@@ -7,8 +7,14 @@ from fastapi import (
     WebSocket,
     WebSocketDisconnect,
 )
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import escape
+from jinja2.bccache import FileSystemBytecodeCache
+from functools import lru_cache
+import asyncio
+import hashlib
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import logging
@@ -21,22 +27,90 @@ from visual_control_board.config.models import (
     DynamicUpdateConfig,
     ActionsConfig,
     ButtonContentUpdate,
+    ButtonContentBatchUpdate,
 )
 from visual_control_board.actions.registry import ActionRegistry
 from visual_control_board.dependencies import (
+    AppRuntime,
+    get_runtime,
     get_ui_config,
-    get_action_registry,
     get_pending_update_flag,
     get_live_update_manager,
     get_live_update_manager_ws,  # Import the new WebSocket-specific dependency
 )
-from visual_control_board.live_updates import LiveUpdateManager
+from visual_control_board.live_updates import LiveUpdateManager, NAV_UPDATE_FRAME
 
 
 logger = logging.getLogger(__name__)
 
 templates_dir = Path(__file__).parent / "templates"
-templates = Jinja2Templates(directory=str(templates_dir))
+
+
+def _build_jinja_env() -> Environment:
+    """
+    Jinja environment tuned for serving rather than development:
+
+    * ``auto_reload=False`` — templates ship inside the package and never
+      change at runtime, so Jinja skips the per-render mtime stat it would
+      otherwise do for every template lookup.
+    * A filesystem bytecode cache (next to the config boot cache) so later
+      processes reuse compiled template code instead of recompiling.
+    """
+    bytecode_cache = None
+    try:
+        bc_dir = Path.home() / ".cache" / "visual_control_board" / "jinja"
+        bc_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=str(bc_dir))
+    except OSError:
+        # Read-only or otherwise unusable home directory: templates simply
+        # compile in-process as before.
+        pass
+    return Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        autoescape=select_autoescape(("html", "htm", "xml")),
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+templates = Jinja2Templates(env=_build_jinja_env())
+
+# Every template this module renders, resolved (and therefore compiled) once
+# at import. Render sites use these references directly, skipping the
+# per-request get_template() name lookup; with auto_reload off the loaded
+# Template objects stay valid for the process lifetime.
+_TPL_PAGE_CONTENT = templates.get_template("partials/page_content.html")
+_TPL_NAV = templates.get_template("partials/nav.html")
+_TPL_TITLE_TAG = templates.get_template("partials/title_tag.html")
+_TPL_HEADER_TITLE_TAG = templates.get_template("partials/header_title_tag.html")
+_TPL_BUTTON = templates.get_template("partials/button.html")
+_TPL_UPDATE_BANNER = templates.get_template("partials/update_banner.html")
+_TPL_INDEX = templates.get_template("index.html")
+
+# The toast partial has a fixed shape with three substitutions, and it is
+# rendered on every button press. A prepared str.format template with explicit
+# markupsafe escaping produces byte-identical output to
+# partials/toast.html without entering the Jinja runtime. If the partial grows
+# any template logic, drop this and go back through `templates`.
+_TOAST_TEMPLATE = (
+    '\n\n<div id="toast-message" hx-swap-oob="true" class="{toast_class}">\n'
+    '    <span id="{message_id}">{message}</span>\n'
+    "    \n"
+    "    \n"
+    "</div>"
+)
+
+
+def _render_toast(
+    message: str,
+    toast_class: str = "toast show",
+    message_id: str = "toast-message-content",
+) -> str:
+    return _TOAST_TEMPLATE.format(
+        toast_class=escape(toast_class),
+        message_id=escape(message_id),
+        message=escape(message),
+    )
 
 router = APIRouter()
 
@@ -44,15 +118,103 @@ router = APIRouter()
 config_router = APIRouter(prefix="/api/v1/config", tags=["Configuration Management"])
 
 
-@config_router.post("/stage", status_code=202)  # 202 Accepted
+@lru_cache(maxsize=2)
+def _update_banner_html(pending_update_available: bool) -> bytes:
+    """
+    The update banner has exactly two states, both request-independent, so
+    each renders (and UTF-8 encodes) once per process; HTMLResponse passes
+    bytes bodies through without re-encoding. Link targets come from the
+    router's url_path_for (relative paths, which HTMX resolves against the
+    document) rather than request.url_for, which would bake the first
+    caller's host into the cached markup.
+    """
+    return _TPL_UPDATE_BANNER.render(
+        {
+            "pending_update_available": pending_update_available,
+            "url_for": lambda name, **params: str(router.url_path_for(name, **params)),
+        }
+    ).encode("utf-8")
+
+
+def _apply_staged_state(request: Request) -> None:
+    """
+    Promotes the staged configuration to current and rebuilds the action registry.
+    Callers are responsible for having validated that a staged config exists
+    and for broadcasting any follow-up UI refresh messages.
+    """
+    actions_unchanged = (
+        request.app.state.staged_actions_config
+        == request.app.state.current_actions_config
+    )
+    request.app.state.current_ui_config = request.app.state.staged_ui_config
+    request.app.state.current_actions_config = request.app.state.staged_actions_config
+
+    if actions_unchanged:
+        # Most staged updates only touch the UI layout. The frozen config
+        # models compare by value, so an identical action set means the
+        # already-loaded registry (imported modules and all) stays valid.
+        new_action_registry = request.app.state.action_registry
+        logger.info("Action set unchanged; keeping existing action registry.")
+    else:
+        # Stage already built and validated a registry for this action set;
+        # promote it rather than importing and wiring everything a second
+        # time. (The rebuild fallback covers state staged by older callers.)
+        new_action_registry = request.app.state.staged_action_registry
+        if new_action_registry is None:
+            new_action_registry = ActionRegistry()
+            new_action_registry.load_actions(request.app.state.current_actions_config)
+        request.app.state.action_registry = new_action_registry
+        logger.info("Action registry re-initialized with new configuration.")
+
+    # Rebuild the frozen runtime snapshot in one atomic assignment.
+    request.app.state.runtime = AppRuntime(
+        ui_config=request.app.state.current_ui_config,
+        actions_config=request.app.state.current_actions_config,
+        action_registry=new_action_registry,
+        live_update_manager=request.app.state.live_update_manager,
+    )
+
+    request.app.state.staged_ui_config = None
+    request.app.state.staged_actions_config = None
+    request.app.state.staged_action_registry = None
+    request.app.state.pending_update_event.clear()
+    # Cached renders and the ETag version tag describe the old configuration.
+    request.app.state.index_html_cache.clear()
+    request.app.state.oob_chrome_cache.clear()
+    request.app.state.config_version_tag = None
+    logger.info("Staged configuration applied and cleared.")
+
+
+@config_router.post("/stage", status_code=202, response_class=ORJSONResponse)  # 202 Accepted
 async def stage_new_configuration(
-    request: Request, update_request: DynamicUpdateConfig
+    request: Request,
+    update_request: DynamicUpdateConfig,
+    apply: bool = False,
+    live_update_mgr: LiveUpdateManager = Depends(get_live_update_manager),
 ):
+    """
+    Stages a new configuration. With `?apply=true`, the staged configuration is
+    applied immediately in the same request, saving API clients a second round
+    trip for the common stage-then-apply sequence.
+    """
     logger.info("Received request to stage new configuration.")
-    temp_action_registry = ActionRegistry()
-    temp_action_registry.load_actions(update_request.actions_config)
-    loaded_action_count = len(temp_action_registry._actions)
-    defined_action_count = len(update_request.actions_config.actions)
+    staged_action_registry: Optional[ActionRegistry] = None
+    if update_request.actions_config == request.app.state.current_actions_config:
+        # Identical action set to what is already live and loaded — no need
+        # to prove it loadable a second time.
+        loaded_action_count = defined_action_count = len(
+            update_request.actions_config.actions
+        )
+    else:
+        staged_action_registry = ActionRegistry()
+        # Module imports during load can hit the filesystem for hundreds of
+        # milliseconds; run them on a worker thread so in-flight button
+        # actions and WebSocket writes aren't stalled behind a config stage.
+        await asyncio.to_thread(
+            staged_action_registry.load_actions, update_request.actions_config
+        )
+        loaded_action_count = len(staged_action_registry._actions)
+        defined_action_count = len(update_request.actions_config.actions)
 
     if loaded_action_count != defined_action_count:
         error_msg = (
@@ -65,16 +227,22 @@ async def stage_new_configuration(
 
     request.app.state.staged_ui_config = update_request.ui_config
     request.app.state.staged_actions_config = update_request.actions_config
-    request.app.state.pending_update_available = True
+    # Kept so apply can promote the validated registry instead of rebuilding
+    # it; None means the live registry already covers the staged action set.
+    request.app.state.staged_action_registry = staged_action_registry
+    request.app.state.pending_update_event.set()
     logger.info("New configuration staged successfully.")
 
-    banner_html = templates.get_template("partials/update_banner.html").render(
-        {"request": request, "pending_update_available": True}
-    )
-    return HTMLResponse(content=banner_html)
+    if apply:
+        _apply_staged_state(request)
+        await live_update_mgr.broadcast_frame(NAV_UPDATE_FRAME)
+        logger.info("Broadcasted navigation_update message to WebSocket clients.")
+        return {"message": "Configuration staged and applied successfully."}
 
+    return HTMLResponse(content=_update_banner_html(True))
 
-@config_router.post("/apply")
+
+@config_router.post("/apply", response_class=ORJSONResponse)
 async def apply_staged_configuration(
     request: Request,
     response: Response,
@@ -84,7 +252,7 @@ async def apply_staged_configuration(
 ):
     logger.info("Received request to apply staged configuration.")
     if (
-        not request.app.state.pending_update_available
+        not request.app.state.pending_update_event.is_set()
         or request.app.state.staged_ui_config is None
         or request.app.state.staged_actions_config is None
     ):
@@ -93,22 +261,11 @@ async def apply_staged_configuration(
             status_code=404, detail="No staged configuration found to apply."
         )
 
-    request.app.state.current_ui_config = request.app.state.staged_ui_config
-    request.app.state.current_actions_config = request.app.state.staged_actions_config
-
-    new_action_registry = ActionRegistry()
-    new_action_registry.load_actions(request.app.state.current_actions_config)
-    request.app.state.action_registry = new_action_registry
-    logger.info("Action registry re-initialized with new configuration.")
-
-    request.app.state.staged_ui_config = None
-    request.app.state.staged_actions_config = None
-    request.app.state.pending_update_available = False
-    logger.info("Staged configuration applied and cleared.")
+    _apply_staged_state(request)
 
     # Broadcast navigation update to all connected WebSocket clients
     # This tells them to refresh their navigation panel.
-    await live_update_mgr.broadcast_json({"type": "navigation_update", "payload": {}})
+    await live_update_mgr.broadcast_frame(NAV_UPDATE_FRAME)
     logger.info("Broadcasted navigation_update message to WebSocket clients.")
 
     # For the client that initiated this action (e.g., by clicking "Apply Update" button),
@@ -122,20 +279,18 @@ async def discard_staged_configuration(request: Request):
     logger.info("Received request to discard staged configuration.")
     request.app.state.staged_ui_config = None
     request.app.state.staged_actions_config = None
-    request.app.state.pending_update_available = False
+    request.app.state.staged_action_registry = None
+    request.app.state.pending_update_event.clear()
     logger.info("Staged configuration discarded.")
 
-    banner_html = templates.get_template("partials/update_banner.html").render(
-        {"request": request, "pending_update_available": False}
-    )
-    return HTMLResponse(content=banner_html)
+    return HTMLResponse(content=_update_banner_html(False))
 
 
 # API Router for live button content updates
 live_updates_router = APIRouter(prefix="/api/v1/buttons", tags=["Live Button Updates"])
 
 
-@live_updates_router.post("/update_content", status_code=200)
+@live_updates_router.post("/update_content", status_code=200, response_class=ORJSONResponse)
 async def push_button_content_update(
     update_data: ButtonContentUpdate,
     live_update_mgr: LiveUpdateManager = Depends(
@@ -146,7 +301,7 @@ async def push_button_content_update(
     Receives a request to update a button's content and broadcasts it via WebSocket.
     """
     logger.info(
-        f"Received request to update content for button_id: {update_data.button_id}"
+        "Received request to update content for button_id: %s", update_data.button_id
     )
 
     await live_update_mgr.broadcast_button_update(
@@ -158,6 +313,28 @@ async def push_button_content_update(
     }
 
 
+@live_updates_router.post("/batch_update", status_code=200, response_class=ORJSONResponse)
+async def push_button_content_batch_update(
+    batch: ButtonContentBatchUpdate,
+    live_update_mgr: LiveUpdateManager = Depends(get_live_update_manager),
+):
+    """
+    Receives several button content updates in one request and broadcasts each
+    via WebSocket. Saves controllers one HTTP round trip per extra button when
+    multiple buttons update in the same tick.
+    """
+    logger.info("Received batch content update for %d button(s).", len(batch.updates))
+
+    for update_data in batch.updates:
+        await live_update_mgr.broadcast_button_update(
+            update_data.model_dump(exclude_none=True)
+        )
+    return {
+        "message": "Button content batch update broadcasted.",
+        "count": len(batch.updates),
+    }
+
+
 # WebSocket endpoint
 @router.websocket("/ws/button_updates")
 async def websocket_button_updates_endpoint(
@@ -174,20 +351,24 @@ async def websocket_button_updates_endpoint(
     )  # This internally calls await websocket.accept()
     try:
         while True:
-            # Keep the connection alive. Clients primarily receive data.
-            # This will block until a message is received or the connection is closed by the client.
-            await websocket.receive_text()
-            # If you expect messages from the client, process them here.
-            # For now, any text received is just logged as a keep-alive or unexpected message.
-            logger.debug(
-                f"Received keep-alive or unexpected message from {websocket.client}"
-            )
-
+            # Keep the connection alive. Clients primarily receive data; this
+            # endpoint never acts on inbound frames, so consume raw ASGI
+            # messages without the text-extraction and per-frame logging that
+            # receive_text() would add for every client ping.
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Received keep-alive or unexpected message from %s",
+                    websocket.client,
+                )
+        logger.info("WebSocket %s disconnected.", websocket.client)
     except WebSocketDisconnect:
-        logger.info(f"WebSocket {websocket.client} disconnected.")
+        logger.info("WebSocket %s disconnected.", websocket.client)
     except Exception as e:
         logger.error(
-            f"Error in WebSocket connection {websocket.client}: {e}", exc_info=True
+            "Error in WebSocket connection %s: %s", websocket.client, e, exc_info=True
         )
     finally:
         live_update_mgr.disconnect(websocket)
@@ -211,7 +392,9 @@ def _render_index_page(
         current_page = all_pages[0]
         current_page_id = current_page.id
         logger.warning(
-            f"Requested page_id '{current_page_id}' not found, defaulting to first page '{current_page.id}'."
+            "Requested page_id '%s' not found, defaulting to first page '%s'.",
+            current_page_id,
+            current_page.id,
         )
     elif not current_page and not all_pages:  # No pages configured at all
         logger.error("No pages configured in UIConfig.")
@@ -219,7 +402,9 @@ def _render_index_page(
         # Fall through to render with error
     elif not current_page:  # Specific page_id not found, but other pages exist
         logger.warning(
-            f"Requested page_id '{current_page_id}' not found. Valid pages: {[p.id for p in all_pages]}"
+            "Requested page_id '%s' not found. Valid pages: %s",
+            current_page_id,
+            [p.id for p in all_pages],
         )
         # This case should ideally be handled by defaulting or a specific error message
         # For now, let it fall through, it might show an error or an empty content area if current_page is None
@@ -232,6 +417,37 @@ def _render_index_page(
     if error_message:
         page_title = "Error - Visual Control Board"
 
+    # The full index render is identical for every request until the config
+    # changes: it depends only on the resolved page and whether the update
+    # banner shows. Successful renders are cached per (page, banner) pair on
+    # app.state and the cache is cleared whenever configuration is staged,
+    # applied or discarded. url_for is overridden with the app's url_path_for
+    # so the cached markup holds relative paths, not the first caller's host.
+    cache: Optional[Dict[Any, bytes]] = getattr(
+        request.app.state, "index_html_cache", None
+    )
+    cache_key = (current_page.id if current_page else None, pending_update_available)
+
+    # Same config-version ETag scheme as the partials: a matching
+    # If-None-Match skips body and render entirely for repeat page loads.
+    etag: Optional[str] = None
+    if error_message is None:
+        etag = (
+            f'"{_config_version_tag(request, ui_config)}'
+            f"-{cache_key[0]}-{int(pending_update_available)}\""
+        )
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+    headers = {"ETag": etag} if etag else None
+
+    if cache is not None and error_message is None:
+        cached_body = cache.get(cache_key)
+        if cached_body is not None:
+            return HTMLResponse(
+                content=cached_body, status_code=status_code, headers=headers
+            )
+
+    app_ref = request.app
     context = {
         "request": request,
         "page_title": page_title,
@@ -240,8 +456,14 @@ def _render_index_page(
         "current_page": current_page,  # This is the PageConfig object for the content area
         "error": error_message,
         "pending_update_available": pending_update_available,
+        "url_for": lambda name, **params: str(app_ref.url_path_for(name, **params)),
     }
-    return templates.TemplateResponse("index.html", context, status_code=status_code)
+    # Cache the encoded body: HTMLResponse accepts bytes as-is, so cache hits
+    # skip the per-request str.encode too.
+    body = _TPL_INDEX.render(context).encode("utf-8")
+    if cache is not None and error_message is None:
+        cache[cache_key] = body
+    return HTMLResponse(content=body, status_code=status_code, headers=headers)
 
 
 @router.get("/", response_class=HTMLResponse, name="get_index_page_root")
@@ -272,7 +494,8 @@ async def get_index_page(
     current_page_obj = ui_config.find_page(initial_page_id)
     if not current_page_obj:
         logger.warning(
-            f"Initial page ID '{initial_page_id}' not found. Defaulting to first available page."
+            "Initial page ID '%s' not found. Defaulting to first available page.",
+            initial_page_id,
         )
         initial_page_id = ui_config.pages[
             0
@@ -283,6 +506,81 @@ async def get_index_page(
     )
 
 
+@lru_cache(maxsize=1024)
+def _not_found_toast(button_id: str) -> str:
+    """
+    Error toast for an unknown button id, cached so a misconfigured client or
+    scanner replaying the same bad ids doesn't re-render per request.
+    """
+    return _render_toast(
+        f"Configuration error: Button ID '{button_id}' not found.",
+        "toast show error",
+    )
+
+
+@lru_cache(maxsize=512)
+def _default_success_toast(action_id: str, button_id: str) -> str:
+    """
+    Rendered toast for the default "action completed" outcome, cached per
+    (action, button) pair since the text never varies between clicks.
+    """
+    return _render_toast(
+        f"Action '{action_id}' completed.",
+        message_id=f"toast-message-content-{button_id}",
+    )
+
+
+def _config_version_tag(request: Request, ui_config: UIConfig) -> str:
+    """
+    Short digest identifying the active UI configuration, computed lazily and
+    cleared on config apply. Used to build ETags for the partial endpoints,
+    whose output only changes when the configuration does.
+    """
+    tag: Optional[str] = getattr(request.app.state, "config_version_tag", None)
+    if tag is None:
+        tag = hashlib.blake2b(
+            ui_config.model_dump_json().encode(), digest_size=8
+        ).hexdigest()
+        request.app.state.config_version_tag = tag
+    return tag
+
+
+def _oob_chrome_html(request: Request, ui_config: UIConfig, page: PageConfig) -> str:
+    """
+    The three OOB-swap fragments accompanying a page-content response (nav
+    with active tab, document title, header title) depend only on the config
+    and the selected page, so each page's chrome renders once per config
+    version and is cached on app.state (cleared on config apply). url_for is
+    overridden with the app's url_path_for, as in the index cache, so cached
+    markup stays host-independent.
+    """
+    cache: Optional[Dict[str, str]] = getattr(
+        request.app.state, "oob_chrome_cache", None
+    )
+    if cache is not None:
+        cached = cache.get(page.id)
+        if cached is not None:
+            return cached
+
+    app_ref = request.app
+    nav_html = _TPL_NAV.render(
+        {
+            "all_pages": ui_config.pages,
+            "current_page_id": page.id,
+            "is_direct_nav_render": False,  # This is for OOB swap
+            "url_for": lambda name, **params: str(app_ref.url_path_for(name, **params)),
+        }
+    )
+    title_html = _TPL_TITLE_TAG.render(
+        {"page_title": f"{page.name} - Visual Control Board"}
+    )
+    header_title_html = _TPL_HEADER_TITLE_TAG.render({"header_title": page.name})
+    chrome = nav_html + title_html + header_title_html
+    if cache is not None:
+        cache[page.id] = chrome
+    return chrome
+
+
 @router.get(
     "/content/page/{page_id:str}", response_class=HTMLResponse, name="get_page_content"
 )
@@ -300,10 +598,16 @@ async def get_page_content_partial(
         )
 
     selected_page = ui_config.find_page(page_id)
+    if selected_page:
+        # The partial is identical for every client until the config changes;
+        # a matching If-None-Match turns the whole render into a 304.
+        etag = f'"{_config_version_tag(request, ui_config)}-{selected_page.id}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
     if not selected_page:
-        logger.warning(f"Page ID '{page_id}' not found for content rendering.")
+        logger.warning("Page ID '%s' not found for content rendering.", page_id)
         # Return an error message within the content area
-        error_content = templates.get_template("partials/page_content.html").render(
+        error_content = _TPL_PAGE_CONTENT.render(
             {
                 "request": request,
                 "page": PageConfig(
@@ -313,7 +617,7 @@ async def get_page_content_partial(
             }
         )
         # Also update nav to show no active tab or handle gracefully
-        nav_html = templates.get_template("partials/nav.html").render(
+        nav_html = _TPL_NAV.render(
             {
                 "request": request,
                 "all_pages": ui_config.pages,
@@ -321,50 +625,26 @@ async def get_page_content_partial(
                 "is_direct_nav_render": False,  # This is for OOB swap
             }
         )
-        title_html = templates.get_template("partials/title_tag.html").render(
+        title_html = _TPL_TITLE_TAG.render(
             {"page_title": "Page Not Found"}
         )
-        header_title_html = templates.get_template(
-            "partials/header_title_tag.html"
-        ).render({"header_title": "Page Not Found"})
+        header_title_html = _TPL_HEADER_TITLE_TAG.render({"header_title": "Page Not Found"})
 
         return HTMLResponse(
             content=error_content + nav_html + title_html + header_title_html
         )
 
-    # Render page content
-    page_content_html = templates.get_template("partials/page_content.html").render(
+    # Render page content; the surrounding OOB chrome (nav with active tab,
+    # title, header) comes from the per-page cache.
+    page_content_html = _TPL_PAGE_CONTENT.render(
         {"request": request, "page": selected_page}
     )
 
-    # Render updated navigation (for OOB swap, to set active class)
-    nav_html = templates.get_template("partials/nav.html").render(
-        {
-            "request": request,
-            "all_pages": ui_config.pages,
-            "current_page_id": selected_page.id,
-            "pending_update_available": pending_update_available,  # Pass this through
-            "is_direct_nav_render": False,  # This is for OOB swap
-        }
-    )
-
-    # Render updated page title (for OOB swap)
-    new_page_title = f"{selected_page.name} - Visual Control Board"
-    title_html = templates.get_template("partials/title_tag.html").render(
-        {"page_title": new_page_title}
-    )
-
-    # Render updated header title (for OOB swap)
-    header_title_html = templates.get_template("partials/header_title_tag.html").render(
-        {"header_title": selected_page.name}
-    )
-
-    # Combine all parts for the response
     # The main page content is first, then OOB swaps
-    full_response_content = (
-        page_content_html + nav_html + title_html + header_title_html
+    full_response_content = page_content_html + _oob_chrome_html(
+        request, ui_config, selected_page
     )
-    return HTMLResponse(content=full_response_content)
+    return HTMLResponse(content=full_response_content, headers={"ETag": etag})
 
 
 @router.get(
@@ -393,7 +673,8 @@ async def get_navigation_panel_partial(
     current_page_id_for_nav = active_page_id
     if active_page_id and not ui_config.find_page(active_page_id):
         logger.warning(
-            f"Requested active_page_id '{active_page_id}' for nav not found in current config. Defaulting."
+            "Requested active_page_id '%s' for nav not found in current config. Defaulting.",
+            active_page_id,
         )
         current_page_id_for_nav = None  # Let template default or pick first
 
@@ -402,7 +683,13 @@ async def get_navigation_panel_partial(
             0
         ].id  # Default to first page if none active or provided invalid
 
-    nav_html = templates.get_template("partials/nav.html").render(
+    # Same config-version ETag scheme as the page-content partial; the active
+    # page id is part of the tag since it selects the highlighted tab.
+    etag = f'"{_config_version_tag(request, ui_config)}-nav-{current_page_id_for_nav}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    nav_html = _TPL_NAV.render(
         {
             "request": request,
             "all_pages": ui_config.pages,
@@ -411,53 +698,51 @@ async def get_navigation_panel_partial(
             "is_direct_nav_render": True,  # Key change: signal direct render
         }
     )
-    return HTMLResponse(content=nav_html)
+    return HTMLResponse(content=nav_html, headers={"ETag": etag})
 
 
 @router.post("/action/{button_id}", response_class=HTMLResponse)
 async def handle_button_action(
     request: Request,
     button_id: str,
-    ui_config: UIConfig = Depends(get_ui_config),
-    action_registry: ActionRegistry = Depends(get_action_registry),
+    runtime: AppRuntime = Depends(get_runtime),
 ):
+    # Hot path: one snapshot dependency instead of separate ui-config and
+    # registry resolutions per press.
+    ui_config = runtime.ui_config
+    action_registry = runtime.action_registry
     if not ui_config:
-        logger.critical(f"UI Configuration not available for button ID: {button_id}.")
+        logger.critical("UI Configuration not available for button ID: %s.", button_id)
         error_message = "Critical Error: UI Configuration not loaded."
-        toast_html = templates.get_template("partials/toast.html").render(
-            {
-                "request": request,
-                "message": error_message,
-                "toast_class": "toast show error",
-            }
+        return HTMLResponse(
+            content=_render_toast(error_message, "toast show error"), status_code=500
         )
-        return HTMLResponse(content=toast_html, status_code=500)
 
     found_config = ui_config.find_button_and_page(button_id)
 
     if not found_config:
-        logger.warning(f"Button ID '{button_id}' not found in UI configuration.")
-        error_message = f"Configuration error: Button ID '{button_id}' not found."
-        toast_html = templates.get_template("partials/toast.html").render(
-            {
-                "request": request,
-                "message": error_message,
-                "toast_class": "toast show error",
-            }
-        )
-        return HTMLResponse(content=toast_html)
+        logger.warning("Button ID '%s' not found in UI configuration.", button_id)
+        return HTMLResponse(content=_not_found_toast(button_id))
 
     _originating_page_config, button_config = found_config
     action_id = button_config.action_id
-    action_params = button_config.action_params.model_dump()
+    action_params = button_config.action_params
 
     logger.info(
-        f"Action for button ID: '{button_id}', Action ID: '{action_id}', Params: {action_params}"
+        "Action for button ID: '%s', Action ID: '%s', Params: %s",
+        button_id,
+        action_id,
+        action_params,
     )
-    result = await action_registry.execute_action(action_id, params=action_params)
-    logger.info(f"Action '{action_id}' for button '{button_id}' result: {result}")
-
-    feedback_message = f"Action '{action_id}' completed."
+    # Sync actions bypass the async wrapper entirely: no coroutine object,
+    # no event-loop trip, just a direct call.
+    if action_registry.is_sync_action(action_id):
+        result = action_registry.execute_action_sync(action_id, params=action_params)
+    else:
+        result = await action_registry.execute_action(action_id, params=action_params)
+    logger.info("Action '%s' for button '%s' result: %s", action_id, button_id, result)
+
+    feedback_message = None
     toast_class = "toast show"
 
     if isinstance(result, dict):
@@ -467,24 +752,30 @@ async def handle_button_action(
             )
             toast_class = "toast show error"
             logger.error(
-                f"Action '{action_id}' for button '{button_id}' error: {feedback_message}"
+                "Action '%s' for button '%s' error: %s",
+                action_id,
+                button_id,
+                feedback_message,
             )
         elif "message" in result:
             feedback_message = str(result["message"])
     elif isinstance(result, str) and result:
         feedback_message = result
 
-    toast_html = templates.get_template("partials/toast.html").render(
-        {
-            "request": request,
-            "message_id": f"toast-message-content-{button_id}",
-            "message": feedback_message,
-            "toast_class": toast_class,
-        }
-    )
+    if feedback_message is None and toast_class == "toast show":
+        # The overwhelmingly common outcome — an action succeeding without a
+        # custom message — renders the same toast every time, so repeated
+        # clicks on the same button reuse one cached string.
+        toast_html = _default_success_toast(action_id, button_id)
+    else:
+        toast_html = _render_toast(
+            feedback_message or f"Action '{action_id}' completed.",
+            toast_class,
+            message_id=f"toast-message-content-{button_id}",
+        )
     # Since button hx-swap="none", this button_html part of response is ignored by the button itself.
     # It's still good practice to have it in case hx-swap behavior changes on button.
-    button_html = templates.get_template("partials/button.html").render(
+    button_html = _TPL_BUTTON.render(
         {
             "request": request,
             "button": button_config,
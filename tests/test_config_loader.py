@@ -0,0 +1,192 @@
+"""
+Tests for ConfigLoader, replacing the old standalone `__main__` block in
+`loader.py`. Everything runs against `tmp_path`, so no test touches the
+real `user_config/` or `config_examples/` directories at the project root.
+"""
+
+import pytest
+import yaml
+
+from visual_control_board.config import loader
+from visual_control_board.config.loader import ConfigLoader
+
+EXAMPLE_UI_CONTENT = {
+    "pages": [
+        {
+            "name": "Main Controls",
+            "id": "main_controls",
+            "layout": "grid",
+            "grid_columns": 2,
+            "buttons": [
+                {
+                    "id": "example_btn",
+                    "text": "Example Button",
+                    "action_id": "example_action",
+                }
+            ],
+        }
+    ]
+}
+
+EXAMPLE_ACTIONS_CONTENT = {
+    "actions": [
+        {
+            "id": "example_action",
+            "module": "example.module",
+            "function": "example_func",
+        }
+    ]
+}
+
+USER_UI_CONTENT = {
+    "pages": [
+        {
+            "name": "User Test Page",
+            "id": "user_test_page",
+            "layout": "grid",
+            "grid_columns": 1,
+            "buttons": [
+                {
+                    "id": "user_btn",
+                    "text": "User Button",
+                    "action_id": "user_action",
+                }
+            ],
+        }
+    ]
+}
+
+USER_ACTIONS_CONTENT = {
+    "actions": [
+        {"id": "user_action", "module": "user.module", "function": "user_func"}
+    ]
+}
+
+
+def _write_yaml(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump(content))
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dirs(monkeypatch, tmp_path):
+    """
+    Points the loader's default user/example directories at tmp_path and
+    disables the cross-process caches so each test starts cold.
+    """
+    user_dir = tmp_path / "user_config"
+    example_dir = tmp_path / "config_examples"
+    monkeypatch.setattr(loader, "DEFAULT_USER_CONFIG_DIR", user_dir)
+    monkeypatch.setattr(
+        loader, "DEFAULT_USER_UI_CONFIG_FILE", user_dir / "ui_config.yaml"
+    )
+    monkeypatch.setattr(
+        loader, "DEFAULT_USER_ACTIONS_CONFIG_FILE", user_dir / "actions_config.yaml"
+    )
+    monkeypatch.setattr(loader, "EXAMPLE_CONFIG_DIR", example_dir)
+    monkeypatch.setattr(
+        loader, "EXAMPLE_UI_CONFIG_FILE", example_dir / "ui_config.yaml"
+    )
+    monkeypatch.setattr(
+        loader, "EXAMPLE_ACTIONS_CONFIG_FILE", example_dir / "actions_config.yaml"
+    )
+    monkeypatch.setenv("VCB_NO_CONFIG_CACHE", "1")
+    loader._parse_config_file.cache_clear()
+    yield
+    loader._parse_config_file.cache_clear()
+
+
+def test_fallback_to_example_configs(tmp_path):
+    """With no user_config files present, loading falls back to the examples."""
+    _write_yaml(loader.EXAMPLE_UI_CONFIG_FILE, EXAMPLE_UI_CONTENT)
+    _write_yaml(loader.EXAMPLE_ACTIONS_CONFIG_FILE, EXAMPLE_ACTIONS_CONTENT)
+
+    config_loader = ConfigLoader()
+    config_loader.load_configs()
+
+    assert config_loader.ui_config is not None
+    assert config_loader.ui_config.pages[0].name == "Main Controls"
+    assert config_loader.actions_config is not None
+    assert len(config_loader.actions_config.actions) == 1
+
+
+def test_user_configs_override_examples(tmp_path):
+    """Files in user_config take precedence over the example configs."""
+    _write_yaml(loader.EXAMPLE_UI_CONFIG_FILE, EXAMPLE_UI_CONTENT)
+    _write_yaml(loader.EXAMPLE_ACTIONS_CONFIG_FILE, EXAMPLE_ACTIONS_CONTENT)
+    _write_yaml(loader.DEFAULT_USER_UI_CONFIG_FILE, USER_UI_CONTENT)
+    _write_yaml(loader.DEFAULT_USER_ACTIONS_CONFIG_FILE, USER_ACTIONS_CONTENT)
+
+    config_loader = ConfigLoader()
+    config_loader.load_configs()
+
+    assert config_loader.ui_config is not None
+    assert config_loader.ui_config.pages[0].name == "User Test Page"
+    assert config_loader.actions_config is not None
+    assert config_loader.actions_config.actions[0].id == "user_action"
+
+
+def test_explicit_path_used_without_fallback(tmp_path):
+    """An explicitly provided path is used as-is, with no fallback probing."""
+    explicit_ui_path = tmp_path / "explicit" / "ui.yaml"
+    _write_yaml(explicit_ui_path, EXAMPLE_UI_CONTENT)
+    _write_yaml(loader.EXAMPLE_ACTIONS_CONFIG_FILE, EXAMPLE_ACTIONS_CONTENT)
+    # A user UI config exists but must be ignored for the explicit load.
+    _write_yaml(loader.DEFAULT_USER_UI_CONFIG_FILE, USER_UI_CONTENT)
+
+    config_loader = ConfigLoader(ui_config_path=explicit_ui_path)
+    config_loader.load_configs()
+
+    assert config_loader.ui_config is not None
+    assert config_loader.ui_config.pages[0].name == "Main Controls"
+    # Actions still follow the default user -> example logic.
+    assert config_loader.actions_config is not None
+
+
+def test_explicit_missing_path_does_not_fall_back(tmp_path):
+    """A missing explicit path yields None instead of silently falling back."""
+    _write_yaml(loader.EXAMPLE_UI_CONFIG_FILE, EXAMPLE_UI_CONTENT)
+    _write_yaml(loader.EXAMPLE_ACTIONS_CONFIG_FILE, EXAMPLE_ACTIONS_CONTENT)
+
+    config_loader = ConfigLoader(ui_config_path=tmp_path / "missing.yaml")
+    config_loader.load_configs()
+
+    assert config_loader.ui_config is None
+    assert config_loader.actions_config is not None
+
+
+def test_peek_config_metadata_reads_scalar_header(tmp_path):
+    """Leading top-level scalar keys are returned; nested values end the peek."""
+    path = tmp_path / "peek.yaml"
+    path.write_text("version: '2'\nname: board\npages:\n  - id: p1\n")
+
+    assert loader.peek_config_metadata(path) == {"version": "2", "name": "board"}
+
+
+def test_peek_config_metadata_rejects_non_mapping(tmp_path):
+    """A document whose top level is not a mapping yields None, not fabricated pairs."""
+    sequence_path = tmp_path / "sequence.yaml"
+    sequence_path.write_text("- a\n- b\n")
+    scalar_path = tmp_path / "scalar.yaml"
+    scalar_path.write_text("just a string\n")
+
+    assert loader.peek_config_metadata(sequence_path) is None
+    assert loader.peek_config_metadata(scalar_path) is None
+
+
+def test_peek_config_metadata_missing_file(tmp_path):
+    """A missing or unreadable file yields None."""
+    assert loader.peek_config_metadata(tmp_path / "absent.yaml") is None
+
+
+def test_peek_config_metadata_truncated_head(tmp_path):
+    """Keys parsed before the max_bytes cutoff survive mid-token truncation."""
+    path = tmp_path / "big.yaml"
+    # The cutoff lands inside the quoted scalar, so the tail fails to scan;
+    # the cleanly parsed header before it must still come back.
+    path.write_text("version: '2'\nname: board\nblob: '" + "x" * 4096 + "'\n")
+
+    assert loader.peek_config_metadata(path, max_bytes=40) == {
+        "version": "2",
+        "name": "board",
+    }